@@ -1,34 +1,128 @@
 #!/usr/bin/env python
 """Post-generation hook for C++ project."""
 
+import importlib.util
+import io
 import os
+import re
+import shutil
+import stat
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Cookiecutter context, rendered once when the hook is generated
+CTX = {
+    "project_name": "{{ cookiecutter.project_name }}",
+    "project_description": "{{ cookiecutter.project_description }}",
+    "cpp_standard": "{{ cookiecutter.cpp_standard }}",
+    "build_system": "{{ cookiecutter.build_system }}",
+    "use_ninja": "{{ cookiecutter.use_ninja }}",
+    "testing_framework": "{{ cookiecutter.testing_framework }}",
+    "enable_cache": "{{ cookiecutter.enable_cache }}",
+    "use_git_hooks": "{{ cookiecutter.use_git_hooks }}",
+    "use_ai": "{{ cookiecutter.use_ai_workflow }}",
+}
+
+# Checkouts searched for shared template assets, in order: the template
+# repo two levels above the generated project and the checkout cookiecutter
+# is generating from. The hook itself runs as a rendered temp-file copy, so
+# the template directory (<root>/cookiecutters/<template>) comes from the
+# context; releases that don't provide _repo_dir skip that root.
+# Canonicalized once, so ".." and symlinks are resolved up front and a
+# checkout reached two ways is probed only once
+SEARCH_ROOTS = tuple(dict.fromkeys(
+    os.path.realpath(root)
+    for root in (
+        os.path.join(os.getcwd(), "..", ".."),
+        # {% if cookiecutter._repo_dir is defined %}
+        os.path.join(r"{{ cookiecutter._repo_dir }}", "..", ".."),
+        # {% endif %}
+    )
+))
+CLAUDE_SOURCE_DIRS = [os.path.join(root, ".github", "claude") for root in SEARCH_ROOTS]
+HIVE_CLAUDE_SOURCES = [os.path.join(root, "docs", "HIVE_CLAUDE.md") for root in SEARCH_ROOTS]
+
+# Template tokens left in the copied CLAUDE.md, matched in one pass. The
+# pattern avoids literal Jinja delimiters so cookiecutter leaves it alone
+CLAUDE_MD_TOKENS = re.compile(
+    rb"\{\{\s*cookiecutter\.(project_name|project_description|cpp_standard)\s*\}\}"
+    rb"|\{\%\s*if cookiecutter\.python_version is defined\s*\%\}.*?"
+    rb"\{\%\s*endif\s*\%\}",
+    re.DOTALL,
+)
+
+# Byte values for those tokens, encoded once. The language conditional has
+# no captured variable name, so it is keyed by None
+CLAUDE_MD_VALUES = {
+    b"project_name": CTX["project_name"].encode(),
+    b"project_description": CTX["project_description"].encode(),
+    b"cpp_standard": CTX["cpp_standard"].encode(),
+    None: f"C++ {CTX['cpp_standard']}".encode(),
+}
 
 
 def run_command(cmd, check=True):
+    # Only the exit status is used, so output goes straight to DEVNULL
+    # instead of through pipes that would be read and then discarded
     try:
         result = subprocess.run(
-            cmd, shell=True, check=check, capture_output=True, text=True
+            cmd, check=check,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
         )
         return result.returncode == 0
     except subprocess.CalledProcessError as e:
         print(f"Error: {e}")
         return False
+    except OSError as e:
+        # Executable not found - the shell used to report this as exit 127
+        if check:
+            print(f"Error: {e}")
+        return False
+
+
+def prepare_repository():
+    """Lay out the generated files and record the initial commit."""
+    # Setup Claude AI context if enabled
+    setup_claude_context()
+    copy_claude_md()
+    initialize_git()
 
 
 def initialize_git():
     print("• Initializing git repository...")
-    run_command("git init")
+    run_command(["git", "init"])
+    run_command(["git", "add", "."])
 
-    # Configure git user if not already configured
-    if not run_command("git config user.name", check=False):
-        run_command('git config user.name "Template User"')
-    if not run_command("git config user.email", check=False):
-        run_command('git config user.email "template@example.com"')
-
-    run_command("git add .")
-    run_command('git commit -m "Initial commit from template"')
+    # Read both identity keys from every config scope in one call, then
+    # supply the template identity, for this commit only, just for the keys
+    # the user has not configured. No git config file is written
+    try:
+        configured = subprocess.run(
+            ["git", "config", "--get-regexp", r"^user\.(name|email)$"],
+            capture_output=True, text=True, check=False,
+        ).stdout
+    except OSError:
+        configured = ""
+    configured_keys = {line.split(" ", 1)[0] for line in configured.splitlines()}
+    identity = []
+    for key, value in (("user.name", "Template User"),
+                       ("user.email", "template@example.com")):
+        if key not in configured_keys:
+            identity += ["-c", f"{key}={value}"]
+
+    # The template content is trusted, so skip hooks and auto-gc and don't
+    # have git print the summary of every new file. --allow-empty makes sure
+    # HEAD exists even if nothing was staged
+    run_command([
+        "git", *identity,
+        "-c", "gc.auto=0",
+        "commit", "--quiet", "--no-verify", "--allow-empty",
+        "-m", "Initial commit from template",
+    ])
 
 
 def setup_build_directory():
@@ -40,9 +134,7 @@ def setup_serena_configuration():
     """Create Serena-specific configuration and memory system for C++ projects."""
     print("• Setting up Serena configuration...")
 
-    use_ai = "{{ cookiecutter.use_ai_workflow }}"
-
-    if use_ai != "yes":
+    if CTX["use_ai"] != "yes":
         print("   ⚠️  AI workflow disabled - skipping Serena configuration")
         return False
 
@@ -54,10 +146,11 @@ def setup_serena_configuration():
         os.makedirs(memories_dir, exist_ok=True)
 
         # Create project configuration file
-        project_name = "{{ cookiecutter.project_name }}"
-        project_description = "{{ cookiecutter.project_description }}"
-        cpp_standard = "{{ cookiecutter.cpp_standard }}"
-        build_system = "{{ cookiecutter.build_system }}"
+        project_name = CTX["project_name"]
+        project_description = CTX["project_description"]
+        cpp_standard = CTX["cpp_standard"]
+        build_system = CTX["build_system"]
+        generator = "Ninja" if CTX["use_ninja"] == "yes" else "Unix Makefiles"
 
         config_content = f"""# Serena Project Configuration
 # Generated by CICD Template for {project_name}
@@ -102,10 +195,7 @@ serena_config:
 # Development workflow integration
 workflow:
   # Serena can use these commands for autonomous development
-  configure_command: >-
-    cmake -B build -G {
-            "Ninja" if "{{ cookiecutter.use_ninja }}" == "yes" else "Unix Makefiles"
-        }
+  configure_command: "cmake -B build -G {generator}"
   clean_build: "rm -rf build && cmake -B build && cmake --build build"
   run_tests: "ctest --test-dir build --verbose"
   static_analysis: "clang-tidy src/**/*.cpp -- -I./include"
@@ -121,8 +211,7 @@ build_variants:
 """
 
         config_file = os.path.join(serena_dir, "config.yml")
-        with open(config_file, "w", encoding="utf-8") as f:
-            f.write(config_content)
+        Path(config_file).write_text(config_content, encoding="utf-8")
 
         print("   • Serena configuration created")
 
@@ -136,27 +225,24 @@ build_variants:
 ## Technical Stack
 - **Language**: C++{cpp_standard}
 - **Build System**: {build_system.upper()}
-- **Testing**: {{
-    'GoogleTest' if '{{ cookiecutter.testing_framework }}' == 'gtest'
-    else 'Catch2/Doctest'
-}}
+- **Testing**: {
+    "GoogleTest" if CTX["testing_framework"] == "gtest"
+    else "Catch2/Doctest"
+}
 - **Code Formatting**: clang-format
 - **Static Analysis**: clang-tidy
-- **Compilation Cache**: {{
-    'sccache enabled' if '{{ cookiecutter.enable_cache }}' == 'yes'
-    else 'sccache disabled'
-}}
-- **Build Generator**: {{
-    'Ninja' if '{{ cookiecutter.use_ninja }}' == 'yes'
-    else 'Unix Makefiles'
-}}
+- **Compilation Cache**: {
+    "sccache enabled" if CTX["enable_cache"] == "yes"
+    else "sccache disabled"
+}
+- **Build Generator**: {generator}
 - **Git Hooks**: Pre-commit hooks installed and configured
 
 ## Project Structure
 ```
 src/           - Main source code directory
 include/       - Header files
-tests/         - Test files using {{ cookiecutter.testing_framework }}
+tests/         - Test files using {CTX["testing_framework"]}
 build/         - Build output directory
 docs/          - Project documentation
 git-hooks/     - Local CI/CD hooks
@@ -165,10 +251,7 @@ configs/       - Tool configuration files
 ```
 
 ## Development Workflow
-1. **Configure Build**: `cmake -B build -G {{
-    "Ninja" if "{{ cookiecutter.use_ninja }}" == "yes"
-    else "Unix Makefiles"
-}}`
+1. **Configure Build**: `cmake -B build -G {generator}`
 2. **Build Project**: `cmake --build build`
 3. **Run Tests**: `ctest --test-dir build --output-on-failure`
 4. **Format Code**: `clang-format -i src/**/*.cpp include/**/*.hpp`
@@ -207,8 +290,7 @@ This project is configured for Serena MCP integration with:
 """
 
         memory_file = os.path.join(memories_dir, "project_overview.md")
-        with open(memory_file, "w", encoding="utf-8") as f:
-            f.write(memory_content)
+        Path(memory_file).write_text(memory_content, encoding="utf-8")
 
         print("   • Initial memory created")
 
@@ -258,8 +340,7 @@ This project is configured for Serena MCP integration with:
 """
 
         guide_file = os.path.join(serena_dir, "USAGE_GUIDE.md")
-        with open(guide_file, "w", encoding="utf-8") as f:
-            f.write(usage_guide)
+        Path(guide_file).write_text(usage_guide, encoding="utf-8")
 
         print("   • Usage guide created")
 
@@ -274,9 +355,7 @@ def install_serena_mcp():
     """Install Serena MCP server for Claude Code with enhanced configuration."""
     print("• Setting up Serena MCP integration...")
 
-    use_ai = "{{ cookiecutter.use_ai_workflow }}"
-
-    if use_ai != "yes":
+    if CTX["use_ai"] != "yes":
         print("   ⚠️  AI workflow disabled - skipping Serena MCP setup")
         return False
 
@@ -284,18 +363,24 @@ def install_serena_mcp():
     setup_serena_configuration()
 
     # Check if Claude Code CLI is available
-    if not run_command("which claude", check=False):
+    if shutil.which("claude") is None:
         print("   ⚠️  Claude Code CLI not found - skipping Serena MCP setup")
         return False
 
     # Check if Serena MCP is already installed
-    if run_command("claude mcp list | grep serena", check=False):
+    mcp_list = subprocess.run(
+        ["claude", "mcp", "list"], capture_output=True, text=True, check=False
+    )
+    if "serena" in mcp_list.stdout:
         print("   • Serena MCP already installed")
         return True
 
     # Install Serena MCP
     print("   • Installing Serena MCP server...")
-    install_cmd = 'claude mcp add-json "serena" \'{"command":"uvx","args":["--from","git+https://github.com/oraios/serena","serena-mcp-server"]}\''
+    install_cmd = [
+        "claude", "mcp", "add-json", "serena",
+        '{"command":"uvx","args":["--from","git+https://github.com/oraios/serena","serena-mcp-server"]}',
+    ]
 
     if run_command(install_cmd, check=False):
         print("   • Serena MCP installed successfully")
@@ -305,32 +390,46 @@ def install_serena_mcp():
         return False
 
 
+def ensure_pre_commit():
+    """Install the pre-commit tool if missing; does not need the git repo."""
+    if CTX["use_git_hooks"] == "no":
+        return False
+
+    # Look for the module in-process first; only walk PATH and spawn pip if
+    # this interpreter can't import it. Install with this interpreter's pip,
+    # a bare "pip" may belong to another Python
+    if (importlib.util.find_spec("pre_commit") is None
+            and shutil.which("pre-commit") is None):
+        print("• Installing pre-commit...")
+        run_command([sys.executable, "-m", "pip", "install", "pre-commit"],
+                    check=False)
+        importlib.invalidate_caches()
+    return True
+
+
 def install_pre_commit():
     """Install pre-commit hooks for C++ projects."""
     print("• Installing pre-commit hooks...")
 
-    use_git_hooks = "{{ cookiecutter.use_git_hooks }}"
-
-    if use_git_hooks == "no":
+    if CTX["use_git_hooks"] == "no":
         print("   ⚠️  Git hooks disabled by configuration")
         return False
 
-    # Check if pre-commit is available in the system
-    if not run_command("which pre-commit", check=False):
-        print("   • Installing pre-commit...")
-        run_command("pip install pre-commit", check=False)
-
-    # Install pre-commit hooks
-    return run_command("pre-commit install", check=False)
+    # Install pre-commit hooks with the pre-commit on PATH, the one the user
+    # runs later; use this interpreter's module only when it is the only copy
+    if (shutil.which("pre-commit") is None
+            and importlib.util.find_spec("pre_commit") is not None):
+        cmd = [sys.executable, "-m", "pre_commit", "install"]
+    else:
+        cmd = ["pre-commit", "install"]
+    return run_command(cmd, check=False)
 
 
 def install_pre_push_hook():
     """Install custom pre-push hook for testing and dynamic analysis."""
     print("• Installing pre-push hook...")
 
-    use_git_hooks = "{{ cookiecutter.use_git_hooks }}"
-
-    if use_git_hooks == "no":
+    if CTX["use_git_hooks"] == "no":
         print("   ⚠️  Git hooks disabled by configuration")
         return False
 
@@ -339,49 +438,109 @@ def install_pre_push_hook():
     pre_push_source = "hooks/pre-push"
     pre_push_target = os.path.join(hooks_dir, "pre-push")
 
-    if os.path.exists(pre_push_source):
-        try:
-            import shutil
-
-            shutil.copy2(pre_push_source, pre_push_target)
-            os.chmod(pre_push_target, 0o755)  # Make executable
-            return True
-        except Exception:
-            return False
-    return False
+    # A missing template hook surfaces as FileNotFoundError from the open,
+    # so there is no separate existence probe. The target is created
+    # executable up front instead of copying metadata and chmod-ing after
+    try:
+        with open(pre_push_source, "rb") as src:
+            fd = os.open(
+                pre_push_target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755
+            )
+            with os.fdopen(fd, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        return True
+    except Exception:
+        return False
 
 
 def print_next_steps():
-    project_name = "{{ cookiecutter.project_name }}"
-    project_slug = "{{ cookiecutter.project_slug }}"
-    build_system = "{{ cookiecutter.build_system }}"
-    use_git_hooks = "{{ cookiecutter.use_git_hooks }}"
-    use_ai = "{{ cookiecutter.use_ai_workflow }}"
-
-    print("\n" + "=" * 60)
-    print("✅ Project created!")
-    print("=" * 60)
-    print(f"\n• Project: {project_name}")
-    print(f"• Build: {build_system}")
-    print(f"• Git Hooks: {use_git_hooks}")
-    print(f"• AI Workflow: {use_ai}")
-
-    if use_git_hooks == "yes":
-        print("\n• Pre-commit hooks are installed and will run automatically")
-        print("• Pre-push hooks are installed and will run tests/dynamic analysis")
-        print("• Run 'pre-commit run --all-files' to check all files manually")
-        print("• 🔴 IMPORTANT: Never use 'git commit --no-verify' - bypasses checks!")
-        print("• 🔴 IMPORTANT: Never use 'git push --no-verify' - bypasses testing!")
-    else:
-        print("\n• Git hooks are disabled - manual quality checks required")
+    # Build the whole banner first and emit it with a single write. The
+    # option-dependent lines are selected by cookiecutter when the hook is
+    # rendered; the Jinja tags sit in comments so the source stays valid Python
+    lines = [
+        "",
+        "=" * 60,
+        "✅ Project created!",
+        "=" * 60,
+        "",
+        f"• Project: {CTX['project_name']}",
+        f"• Build: {CTX['build_system']}",
+        f"• Git Hooks: {CTX['use_git_hooks']}",
+        f"• AI Workflow: {CTX['use_ai']}",
+        "",
+        # {% if cookiecutter.use_git_hooks == "yes" %}
+        "• Pre-commit hooks are installed and will run automatically",
+        "• Pre-push hooks are installed and will run tests/dynamic analysis",
+        "• Run 'pre-commit run --all-files' to check all files manually",
+        "• 🔴 IMPORTANT: Never use 'git commit --no-verify' - bypasses checks!",
+        "• 🔴 IMPORTANT: Never use 'git push --no-verify' - bypasses testing!",
+        # {% else %}
+        "• Git hooks are disabled - manual quality checks required",
+        # {% endif %}
+        # {% if cookiecutter.use_ai_workflow == "yes" %}
+        "• Serena MCP integration is configured for enhanced AI capabilities",
+        # {% endif %}
+        "",
+        "• Create GitHub repository and push:",
+        "  1. Create a new repository on GitHub",
+        "  2. git remote add origin <your-github-repo-url>",
+        "  3. git push -u origin main",
+    ]
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    if use_ai == "yes":
-        print("• Serena MCP integration is configured for enhanced AI capabilities")
 
-    print("\n• Create GitHub repository and push:")
-    print("  1. Create a new repository on GitHub")
-    print("  2. git remote add origin <your-github-repo-url>")
-    print("  3. git push -u origin main")
+def first_existing(paths):
+    """Return the first of paths that exists, or None.
+
+    Each candidate costs a single stat, and the search stops at the first hit.
+    """
+    for path in paths:
+        try:
+            os.stat(path)
+        except OSError:
+            continue
+        return path
+    return None
+
+
+class WorkerOutput(io.TextIOBase):
+    """Stand-in for sys.stdout that holds back what worker threads print.
+
+    A step run through capture() prints into its own buffer, and release()
+    writes that out when the step is joined, so its lines never land in the
+    middle of the main thread's. Everything else goes straight through.
+    """
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+        self.buffers = {}
+
+    def write(self, text):
+        return self.buffers.get(threading.get_ident(), self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def capture(self, step):
+        """Run step with its output buffered; return (result, output)."""
+        ident = threading.get_ident()
+        self.buffers[ident] = buffer = io.StringIO()
+        try:
+            result = step()
+        except BaseException:
+            # Keep whatever the step printed before it failed
+            self.stream.write(buffer.getvalue())
+            raise
+        finally:
+            del self.buffers[ident]
+        return result, buffer.getvalue()
+
+    def release(self, future):
+        """Write out a captured step's output and return its result."""
+        result, output = future.result()
+        self.stream.write(output)
+        return result
 
 
 def setup_claude_context():
@@ -389,68 +548,48 @@ def setup_claude_context():
     for new projects."""
     print("• Setting up Claude AI context...")
 
-    use_ai = "{{ cookiecutter.use_ai_workflow }}"
-
-    if use_ai != "yes":
+    if CTX["use_ai"] != "yes":
         print("   ⚠️  AI workflow disabled - skipping Claude context setup")
         return False
 
-    # Ensure .github/claude directory exists
+    # copytree below creates .github/claude and any parents itself
     claude_dir = ".github/claude"
-    os.makedirs(claude_dir, exist_ok=True)
-
-    # Define source directory paths - try multiple approaches
-    script_dir = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    )
-    possible_source_dirs = [
-        # Try from current working directory (most reliable after cookiecutter)
-        os.path.join(os.getcwd(), "..", "..", ".github", "claude"),
-        # Try from script directory
-        os.path.join(script_dir, ".github", "claude"),
-        # Try absolute path fallback
-        "/home/jokh38/apps/CICD_template/.github/claude",
-    ]
 
-    source_claude_dir = None
-    for path in possible_source_dirs:
-        if os.path.exists(path):
-            source_claude_dir = path
-            break
+    source_claude_dir = first_existing(CLAUDE_SOURCE_DIRS)
 
     if not source_claude_dir:
         print("   ⚠️  Source .github/claude/ directory not found")
         return False
 
     # Copy entire .github/claude/ directory structure
-    import shutil
-
     copied_files = []
 
     try:
-        # Walk through source directory and copy all files
-        for root, _dirs, files in os.walk(source_claude_dir):
-            # Calculate relative path from source_claude_dir
-            rel_path = os.path.relpath(root, source_claude_dir)
-            if rel_path != ".":
-                target_dir = os.path.join(claude_dir, rel_path)
-            else:
-                target_dir = claude_dir
-
-            # Create target directory if it doesn't exist
-            os.makedirs(target_dir, exist_ok=True)
-
-            for file in files:
-                source_file = os.path.join(root, file)
-                target_file = os.path.join(target_dir, file)
-
-                # Copy file
-                shutil.copy2(source_file, target_file)
-                copied_files.append(os.path.relpath(target_file))
-
-                # Customize CLAUDE.md if this is the file
-                if file == "CLAUDE.md":
-                    customize_claude_md(target_file)
+        def copy_file(source_file, target_file):
+            # Contents and mode bits only. The file data is copied in-kernel,
+            # and the generated files get their own inodes rather than
+            # hardlinks, so edits in the project never reach the template
+            copied_files.append(target_file)
+            return shutil.copy(source_file, target_file)
+
+        # Mirror the whole tree in one call; copytree scans each directory
+        # once and creates the target directories as it goes
+        shutil.copytree(
+            source_claude_dir, claude_dir,
+            dirs_exist_ok=True, copy_function=copy_file,
+        )
+
+        # copytree also replays the template's directory modes; keep the
+        # project's own directories writable when the checkout is read-only
+        for directory, _, _ in os.walk(claude_dir):
+            mode = os.stat(directory).st_mode
+            if not mode & stat.S_IWUSR:
+                os.chmod(directory, mode | stat.S_IWUSR)
+
+        # Customize CLAUDE.md if it was part of the tree
+        claude_md = os.path.join(claude_dir, "CLAUDE.md")
+        if claude_md in copied_files:
+            customize_claude_md(claude_md)
 
         print(f"   • Copied {len(copied_files)} AI workflow files to .github/claude/")
         return True
@@ -463,36 +602,33 @@ def setup_claude_context():
 def customize_claude_md(claude_md_path):
     """Customize CLAUDE.md file with project-specific values."""
     try:
-        # Read the file
-        with open(claude_md_path, encoding="utf-8") as f:
-            content = f.read()
-
-        # Get actual cookiecutter values
-        project_name = "{{ cookiecutter.project_name }}"
-        project_description = "{{ cookiecutter.project_description }}"
-        cpp_standard = "{{ cookiecutter.cpp_standard }}"
-
-        # Replace cookiecutter variables with actual project values
-        replacements = {
-            "{{cookiecutter.project_name}}": project_name,
-            "{{cookiecutter.project_description}}": project_description,
-            "{{cookiecutter.cpp_standard}}": cpp_standard,
-        }
-
-        for template_var, actual_value in replacements.items():
-            content = content.replace(template_var, actual_value)
-
-        # Handle Jinja2 conditionals for C++ projects
-        conditional_str = (
-            "{% if cookiecutter.python_version is defined %}Python "
-            "{{cookiecutter.python_version}}{% else %}C++ "
-            "{{cookiecutter.cpp_standard}}{% endif %}"
+        # Work on raw bytes; the substitutions never need decoded text
+        claude_md = Path(claude_md_path)
+        original = claude_md.read_bytes()
+
+        # Replace cookiecutter variables and the language conditional with
+        # actual project values in a single pass
+        content = CLAUDE_MD_TOKENS.sub(
+            lambda m: CLAUDE_MD_VALUES[m.group(1)], original
         )
-        content = content.replace(conditional_str, f"C++ {cpp_standard}")
 
-        # Write the customized file
-        with open(claude_md_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Nothing to substitute - leave the copied file as it is
+        if content == original:
+            return True
+
+        # Write to a sibling temp file and rename it over CLAUDE.md, so the
+        # file is never left half-written
+        fd, tmp_path = tempfile.mkstemp(
+            dir=claude_md.parent, prefix=".CLAUDE.md."
+        )
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(content)
+            shutil.copymode(claude_md, tmp_path)
+            os.replace(tmp_path, claude_md)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
 
         return True
 
@@ -503,28 +639,9 @@ def customize_claude_md(claude_md_path):
 
 def copy_claude_md():
     """Copy HIVE_CLAUDE.md from docs/ directory as CLAUDE.md to project root."""
-    import shutil
-
     print("• Setting up CLAUDE.md documentation...")
 
-    # Define possible source paths for HIVE_CLAUDE.md
-    script_dir = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    )
-    possible_source_paths = [
-        # Try from current working directory (most reliable after cookiecutter)
-        os.path.join(os.getcwd(), "..", "..", "docs", "HIVE_CLAUDE.md"),
-        # Try from script directory
-        os.path.join(script_dir, "docs", "HIVE_CLAUDE.md"),
-        # Try absolute path fallback
-        "/home/jokh38/apps/CICD_template/docs/HIVE_CLAUDE.md",
-    ]
-
-    source_hive_claude = None
-    for path in possible_source_paths:
-        if os.path.exists(path):
-            source_hive_claude = path
-            break
+    source_hive_claude = first_existing(HIVE_CLAUDE_SOURCES)
 
     if not source_hive_claude:
         print("   ⚠️  Source HIVE_CLAUDE.md not found in docs/")
@@ -542,12 +659,22 @@ def copy_claude_md():
 
 def main():
     try:
-        # Setup Claude AI context if enabled
-        setup_claude_context()
-        copy_claude_md()
-
-        initialize_git()
-        setup_build_directory()
+        # The repository (project files plus initial commit), the pre-commit
+        # tool and the build directory are independent, so overlap the file
+        # copies and git I/O with the pip download. Each step's output is
+        # held back and printed in order as it is joined
+        sys.stdout = output = WorkerOutput(sys.stdout)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(output.capture, step)
+                for step in (
+                    prepare_repository, ensure_pre_commit, setup_build_directory,
+                )
+            ]
+            for future in futures:
+                output.release(future)
+
+        # Hook installation needs both .git and the pre-commit tool
         install_pre_commit()
         install_pre_push_hook()
         install_serena_mcp()